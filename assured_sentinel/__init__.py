@@ -5,11 +5,14 @@ This package provides statistical guarantees for AI-generated code safety
 using Conformal Prediction and deterministic SAST scoring.
 """
 
-from assured_sentinel.core.commander import Commander
-from assured_sentinel.core.scorer import BanditScorer
-from assured_sentinel.core.calibrator import ConformalCalibrator
-from assured_sentinel.models import VerificationResult, CalibrationData
-from assured_sentinel.config import Settings
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from assured_sentinel.config import Settings
+    from assured_sentinel.core.calibrator import ConformalCalibrator
+    from assured_sentinel.core.commander import Commander
+    from assured_sentinel.core.scorer import BanditScorer
+    from assured_sentinel.models import CalibrationData, VerificationResult
 
 __version__ = "2.0.0"
 __all__ = [
@@ -20,3 +23,28 @@ __all__ = [
     "CalibrationData",
     "Settings",
 ]
+
+# Public names resolved lazily (PEP 562) so importing the package for
+# lightweight uses (e.g. the CLI reading __version__) does not pull in
+# bandit, numpy, and pydantic-settings transitively.
+_EXPORTS = {
+    "Commander": "assured_sentinel.core.commander",
+    "BanditScorer": "assured_sentinel.core.scorer",
+    "ConformalCalibrator": "assured_sentinel.core.calibrator",
+    "VerificationResult": "assured_sentinel.models",
+    "CalibrationData": "assured_sentinel.models",
+    "Settings": "assured_sentinel.config",
+}
+
+
+def __getattr__(name: str):
+    """Resolve a public re-export on first access and cache it."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from assured_sentinel.config import Settings, get_settings
@@ -29,6 +30,58 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _build_kernel(
+    endpoint: str,
+    api_key: str,
+    deployment: str,
+    temperature: float,
+    top_p: float,
+):
+    """
+    Build a Semantic Kernel wired to Azure OpenAI, cached per configuration.
+
+    Kernel construction and service registration carry nontrivial setup
+    cost (including the underlying HTTP client and its connection pool),
+    so analysts pointing at the same endpoint/deployment with the same
+    sampling settings share a single kernel and function. Failures are
+    not cached: lru_cache only memoizes successful returns.
+
+    Returns:
+        Tuple of (kernel, kernel function, KernelArguments class).
+    """
+    import semantic_kernel as sk
+    from semantic_kernel.connectors.ai.open_ai import (
+        AzureChatCompletion,
+        AzureChatPromptExecutionSettings,
+    )
+    from semantic_kernel.functions import KernelArguments
+
+    kernel = sk.Kernel()
+    kernel.add_service(
+        AzureChatCompletion(
+            service_id="analyst",
+            deployment_name=deployment,
+            endpoint=endpoint,
+            api_key=api_key,
+        )
+    )
+
+    # Configure execution settings
+    req_settings = AzureChatPromptExecutionSettings(service_id="analyst")
+    req_settings.temperature = temperature
+    req_settings.top_p = top_p
+
+    function = kernel.add_function(
+        plugin_name="AnalystPlugin",
+        function_name="generate_code",
+        prompt=AzureAnalyst.PROMPT_TEMPLATE,
+        prompt_execution_settings=req_settings,
+    )
+
+    return kernel, function, KernelArguments
+
+
 # =============================================================================
 # Abstract Base Analyst
 # =============================================================================
@@ -150,51 +203,27 @@ USER REQUEST:
             raise MissingCredentialsError(missing)
     
     def _initialize_kernel(self) -> None:
-        """Initialize Semantic Kernel with Azure OpenAI service."""
+        """Initialize Semantic Kernel with Azure OpenAI service (cached)."""
         try:
-            import semantic_kernel as sk
-            from semantic_kernel.connectors.ai.open_ai import (
-                AzureChatCompletion,
-                AzureChatPromptExecutionSettings,
+            self._kernel, self._function, self._KernelArguments = _build_kernel(
+                self._settings.azure_openai_endpoint,
+                self._settings.azure_openai_api_key,
+                self._settings.azure_openai_deployment,
+                self._config.temperature,
+                self._config.top_p,
             )
-            from semantic_kernel.functions import KernelArguments
         except ImportError as e:
             raise LLMConnectionError(
                 "Azure OpenAI",
                 details=f"semantic-kernel not installed: {e}",
             )
-        
-        self._kernel = sk.Kernel()
-        self._KernelArguments = KernelArguments
-        
-        try:
-            self._kernel.add_service(
-                AzureChatCompletion(
-                    service_id="analyst",
-                    deployment_name=self._settings.azure_openai_deployment,
-                    endpoint=self._settings.azure_openai_endpoint,
-                    api_key=self._settings.azure_openai_api_key,
-                )
-            )
         except Exception as e:
             raise LLMConnectionError(
                 "Azure OpenAI",
                 self._settings.azure_openai_endpoint,
                 str(e),
             )
-        
-        # Configure execution settings
-        req_settings = AzureChatPromptExecutionSettings(service_id="analyst")
-        req_settings.temperature = self._config.temperature
-        req_settings.top_p = self._config.top_p
-        
-        self._function = self._kernel.add_function(
-            plugin_name="AnalystPlugin",
-            function_name="generate_code",
-            prompt=self.PROMPT_TEMPLATE,
-            prompt_execution_settings=req_settings,
-        )
-        
+
         logger.info("Semantic Kernel initialized for Azure OpenAI")
     
     async def generate(self, prompt: str) -> str:
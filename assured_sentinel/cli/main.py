@@ -15,20 +15,17 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import asyncio
-import glob
-import json
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import NoReturn
+from typing import Iterator
 
 from assured_sentinel import __version__
-from assured_sentinel.config import Settings, get_settings
-from assured_sentinel.core.commander import Commander
-from assured_sentinel.core.scorer import BanditScorer
-from assured_sentinel.models import VerificationStatus
+
+# Heavy modules (commander -> scorer -> bandit, settings, asyncio) are
+# imported inside the subcommand handlers that need them, so --help and
+# --version stay fast.
 
 # ANSI color codes
 GREEN = "\033[92m"
@@ -53,6 +50,8 @@ def setup_logging(level: str = "INFO") -> None:
 
 def cmd_verify(args: argparse.Namespace) -> int:
     """Handle the verify command."""
+    from assured_sentinel.core.commander import Commander
+
     # Get code from file or argument
     if args.file:
         filepath = Path(args.file)
@@ -80,6 +79,8 @@ def cmd_verify(args: argparse.Namespace) -> int:
     
     # Output format
     if args.json:
+        import json
+
         print(json.dumps(result.to_dict(), indent=2))
     else:
         status_symbol = "✅" if result.passed else "🚫"
@@ -128,7 +129,9 @@ def cmd_demo(args: argparse.Namespace) -> int:
 This demo shows the core verification flow without requiring
 an Azure OpenAI API key. We test pre-defined code samples.
 """)
-    
+
+    from assured_sentinel.core.commander import Commander
+
     # Initialize with demo threshold
     commander = Commander()
     commander.threshold = 0.15
@@ -193,8 +196,31 @@ an Azure OpenAI API key. We test pre-defined code samples.
     return 0
 
 
+def _iter_python_files(root: Path, recursive: bool) -> Iterator[Path]:
+    """
+    Yield .py files under root using os.scandir.
+
+    Unlike Path.glob("**/*.py"), this streams entries with a single
+    stat per entry and no fnmatch pass, and skips directories it
+    cannot read instead of aborting the scan.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and entry.name.endswith(".py"):
+                        yield Path(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
 def cmd_scan(args: argparse.Namespace) -> int:
     """Scan a directory of Python files."""
+    from assured_sentinel.core.commander import Commander
+
     commander = Commander()
     if args.threshold:
         commander.threshold = args.threshold
@@ -208,19 +234,25 @@ def cmd_scan(args: argparse.Namespace) -> int:
     if path.is_file():
         files = [path]
     else:
-        pattern = "**/*.py" if args.recursive else "*.py"
-        files = list(path.glob(pattern))
+        files = list(_iter_python_files(path, args.recursive))
     
     if not files:
         print(f"{YELLOW}No Python files found in '{args.path}'{RESET}")
         return 0
     
     results = {"passed": 0, "rejected": 0, "files": []}
-    
-    for filepath in files:
-        code = filepath.read_text()
-        result = commander.verify(code)
-        
+
+    # Score the whole batch in one scorer pass instead of one per file.
+    # Bytes-read + decode skips text-mode incremental decoding, and
+    # errors="replace" keeps one undecodable file from killing the scan.
+    codes = [
+        filepath.read_bytes().decode("utf-8", errors="replace")
+        for filepath in files
+    ]
+    verifications = commander.verify_many(codes)
+
+    for filepath, result in zip(files, verifications):
+
         file_result = {
             "file": str(filepath),
             "status": result.status.value,
@@ -241,6 +273,8 @@ def cmd_scan(args: argparse.Namespace) -> int:
     print(f"Total: {len(files)} | Passed: {results['passed']} | Rejected: {results['rejected']}")
     
     if args.json:
+        import json
+
         print(json.dumps(results, indent=2))
     
     return 1 if results["rejected"] > 0 else 0
@@ -248,6 +282,11 @@ def cmd_scan(args: argparse.Namespace) -> int:
 
 def cmd_run(args: argparse.Namespace) -> int:
     """Run the LLM correction loop."""
+    import asyncio
+
+    from assured_sentinel.config import get_settings
+    from assured_sentinel.core.commander import Commander
+
     settings = get_settings()
     
     if not settings.has_azure_credentials:
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -60,6 +61,11 @@ SYNTHETIC_VULNERABILITIES = [
     "assert user_is_admin",
 ]
 
+# Single DFA pass over a sample beats any(v in s for v in ...) substring
+# scans once the vocabulary grows; also reusable by tests that need to
+# detect injected patterns.
+_VULN_RE = re.compile("|".join(re.escape(v) for v in SYNTHETIC_VULNERABILITIES))
+
 
 # =============================================================================
 # Dataset Loaders
@@ -76,14 +82,17 @@ class MBPPDatasetLoader:
     inject known-bad patterns to ensure the calibration threshold is meaningful.
     """
     
-    def __init__(self, injection_rate: float = 0.2):
+    def __init__(self, injection_rate: float = 0.2, seed: int | None = None):
         """
         Initialize MBPP dataset loader.
-        
+
         Args:
             injection_rate: Rate of synthetic vulnerability injection (default: 20%).
+            seed: Seed for the injection RNG. Pass a fixed value for
+                reproducible calibration sets.
         """
         self._injection_rate = injection_rate
+        self._rng = np.random.default_rng(seed)
     
     def load(self, n_samples: int) -> list[str]:
         """
@@ -125,13 +134,15 @@ class MBPPDatasetLoader:
     def _inject_vulnerabilities(self, samples: list[str]) -> list[str]:
         """
         Inject synthetic vulnerabilities into samples.
-        
-        Overwrites the last N samples (where N = injection_rate * len(samples))
-        with known-vulnerable patterns.
-        
+
+        Overwrites N samples (where N = injection_rate * len(samples))
+        with known-vulnerable patterns. Positions and patterns are drawn
+        in two vectorized RNG calls rather than per-sample, and the
+        draw is reproducible when the loader is seeded.
+
         Args:
             samples: Original code samples.
-            
+
         Returns:
             Samples with vulnerabilities injected.
         """
@@ -140,11 +151,18 @@ class MBPPDatasetLoader:
             f"Injecting {injection_count} synthetic vulnerabilities "
             f"({self._injection_rate * 100:.0f}%)"
         )
-        
-        for i in range(1, injection_count + 1):
-            pattern = SYNTHETIC_VULNERABILITIES[i % len(SYNTHETIC_VULNERABILITIES)]
-            samples[-i] = pattern
-        
+        if injection_count == 0:
+            return samples
+
+        positions = self._rng.choice(
+            len(samples), size=injection_count, replace=False
+        )
+        pattern_indices = self._rng.integers(
+            0, len(SYNTHETIC_VULNERABILITIES), size=injection_count
+        )
+        for pos, idx in zip(positions.tolist(), pattern_indices.tolist()):
+            samples[pos] = SYNTHETIC_VULNERABILITIES[idx]
+
         return samples
 
 
@@ -173,6 +191,25 @@ class StaticDatasetLoader:
 # Calibrator
 # =============================================================================
 
+def _quantile_higher(scores: np.ndarray, q_level: float) -> float:
+    """
+    Order statistic equivalent to np.quantile(..., method="higher").
+
+    np.quantile sorts the whole array; the "higher" method only needs
+    the k-th order statistic, so np.partition gets there in O(n)
+    instead of O(n log n) and without ordering the rest of the copy.
+
+    Args:
+        scores: Non-conformity scores (float64 array, n >= 1).
+        q_level: Quantile level in [0, 1].
+
+    Returns:
+        The smallest score at or above the requested quantile.
+    """
+    k = int(np.ceil(q_level * (scores.size - 1)))
+    return float(np.partition(scores, k)[k])
+
+
 class ConformalCalibrator:
     """
     Computes calibration threshold using Split Conformal Prediction.
@@ -189,32 +226,44 @@ class ConformalCalibrator:
         0.5
     """
     
-    def calibrate(self, scores: list[float], alpha: float) -> float:
+    def calibrate(self, scores: list[float] | np.ndarray, alpha: float) -> float:
         """
         Compute calibration threshold from scores.
-        
+
         Uses the mathematical correction for finite sample size:
         q_level = ceil((n + 1) * (1 - α)) / n
-        
+
         Args:
-            scores: List of non-conformity scores from calibration set.
+            scores: Non-conformity scores from the calibration set.
+                Accepts a list or ndarray; converted once up front so
+                the quantile runs on a float64 array (a no-op copy when
+                the caller already hands one over).
             alpha: Risk tolerance (e.g., 0.1 for 10% error rate).
-            
+
         Returns:
             Calibrated threshold (q̂).
-            
+
         Raises:
             InsufficientSamplesError: If not enough samples provided.
         """
+        scores = np.asarray(scores, dtype=np.float64)
         n = len(scores)
         if n < 2:
             raise InsufficientSamplesError(required=2, available=n)
-        
+
+        # Flat score distributions (every quantile equals the constant)
+        # are common with mocked or debugging scorers; two vectorized
+        # reductions beat the selection pass.
+        lo = float(scores.min())
+        if lo == float(scores.max()):
+            logger.info(f"Calibration: n={n}, α={alpha}, q̂={lo} (constant scores)")
+            return lo
+
         # Mathematical correction for Split Conformal Prediction
         q_level = np.ceil((n + 1) * (1 - alpha)) / n
         q_level = min(1.0, q_level)
-        
-        q_hat = float(np.quantile(scores, q_level, method="higher"))
+
+        q_hat = _quantile_higher(scores, q_level)
         
         logger.info(f"Calibration: n={n}, α={alpha}, q̂={q_hat}")
         
@@ -346,18 +395,31 @@ class CalibrationRunner:
         
         return calibration_data
     
-    def _score_samples(self, samples: list[str], verbose: bool) -> list[float]:
-        """Score all samples."""
-        scores = []
+    def _score_samples(self, samples: list[str], verbose: bool) -> np.ndarray:
+        """
+        Score all samples into a preallocated NumPy array.
+
+        Uses the scorer's batch interface when one is defined, so the
+        whole calibration set pays scorer startup costs once instead of
+        per sample. Preallocating float64 storage avoids list growth and
+        boxed-float overhead, and hands the calibrator an ndarray ready
+        for the vectorized quantile step. float64 keeps each stored
+        value exactly equal to the Python float the scorer returned.
+        """
         total = len(samples)
-        
+
+        # Resolve on the type so duck-typed test doubles without a real
+        # batch method fall back to per-sample scoring.
+        if getattr(type(self._scorer), "score_many", None) is not None:
+            return np.asarray(self._scorer.score_many(samples), dtype=np.float64)
+
+        scores = np.empty(total, dtype=np.float64)
         for i, code in enumerate(samples):
-            score = self._scorer.score(code)
-            scores.append(score)
-            
+            scores[i] = self._scorer.score(code)
+
             if verbose and (i + 1) % 20 == 0:
                 print(f"  Scoring progress: {i + 1}/{total}")
-        
+
         return scores
 
 
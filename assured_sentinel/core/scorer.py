@@ -17,15 +17,17 @@ For production optimization options, see docs/Decision-log.md D-011.
 
 from __future__ import annotations
 
+import ast
+import hashlib
 import json
 import logging
 import re
-import shutil
 import subprocess
 import tempfile
 from abc import ABC, abstractmethod
 from functools import lru_cache
 from pathlib import Path
+from shutil import which as _which
 from typing import TYPE_CHECKING
 
 from assured_sentinel.exceptions import (
@@ -47,6 +49,55 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Tokens that appear in essentially every pattern Bandit can flag.
+# Code containing none of them has no realistic path to a finding, so
+# the opt-in pre-filter (ScoringConfig.use_prefilter) can short-circuit
+# to 0.0 without paying for a full Bandit analysis.
+_SUSPICIOUS_RE = re.compile(
+    r"\b(exec|eval|pickle|marshal|shelve|subprocess|os\.system|yaml\.load"
+    r"|__import__|compile|input|Popen|shell=True|assert|random"
+    r"|hashlib\.md5|hashlib\.sha1|tempfile|socket|paramiko|requests"
+    r"|ftplib|telnetlib|xml|sql|password|secret|token|key)\b",
+    re.IGNORECASE,
+)
+
+try:
+    # orjson decodes Bandit's JSON reports several times faster than the
+    # stdlib; fall back silently since it is an optional dependency.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=1)
+def _load_bandit_api() -> tuple | None:
+    """
+    Import Bandit's Python API and build its config once (cached).
+
+    Importing bandit.core and constructing BanditConfig triggers plugin
+    discovery, which dominates Bandit's startup cost. Caching the pair
+    amortizes that across the process lifetime for in-process scoring.
+
+    Returns:
+        Tuple of (BanditManager class, BanditConfig instance),
+        or None if the bandit package is not importable.
+    """
+    try:
+        from bandit.core import config as bandit_config
+        from bandit.core import extension_loader
+        from bandit.core import manager as bandit_manager
+    except ImportError:
+        logger.warning("bandit package not importable; in-process scoring unavailable")
+        return None
+
+    # Touching the extension manager forces the one-time plugin registry
+    # discovery (entry-point enumeration) here, inside the cached call,
+    # so no later scoring call pays it.
+    _ = extension_loader.MANAGER
+    return bandit_manager.BanditManager, bandit_config.BanditConfig()
+
 
 # =============================================================================
 # Code Sanitizer
@@ -59,31 +110,44 @@ class MarkdownCodeSanitizer:
     Implements ICodeSanitizer protocol.
     """
     
-    # Patterns for markdown code fences
-    _START_FENCE_PATTERN = re.compile(r"^```[a-zA-Z]*\n", re.MULTILINE)
-    _END_FENCE_PATTERN = re.compile(r"\n```$", re.MULTILINE)
-    
     def sanitize(self, code: str) -> str:
         """
         Remove markdown code fences and normalize whitespace.
-        
+
+        Results are memoized: LLM output often repeats boilerplate
+        snippets verbatim, and a cache hit is a dict lookup instead of
+        re-slicing the string.
+
         Args:
             code: Raw code string, possibly with markdown fences.
-            
+
         Returns:
             Cleaned code string ready for analysis.
         """
         if not code:
             return ""
-            
+        return self._sanitize_cached(code)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _sanitize_cached(code: str) -> str:
+        """Fence-stripping core, cached per input string.
+
+        Fences only ever appear at the very start and end of a snippet,
+        so plain startswith/endswith slicing covers every case the old
+        regexes did without the regex-engine overhead per call.
+        """
         cleaned = code.strip()
-        
-        # Remove starting ```python or ```
-        cleaned = self._START_FENCE_PATTERN.sub("", cleaned)
-        
+
+        # Remove starting ```python or ``` (drop the whole fence line)
+        if cleaned.startswith("```"):
+            newline = cleaned.find("\n")
+            cleaned = cleaned[newline + 1:] if newline != -1 else cleaned[3:]
+
         # Remove ending ```
-        cleaned = self._END_FENCE_PATTERN.sub("", cleaned)
-        
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3]
+
         return cleaned.strip()
 
 
@@ -134,10 +198,11 @@ class StandardTempFileManager:
             path: Path to the file to delete.
         """
         try:
-            if path.exists():
-                path.unlink()
+            # missing_ok folds the exists-check into the unlink: one
+            # syscall per cleanup instead of a stat followed by unlink.
+            path.unlink(missing_ok=True)
         except OSError as e:
-            logger.warning(f"Failed to cleanup temp file {path}: {e}")
+            logger.warning("Failed to cleanup temp file %s: %s", path, e)
 
 
 class RamdiskTempFileManager(StandardTempFileManager):
@@ -185,6 +250,7 @@ class BaseScoringService(ABC):
         """
         self._sanitizer = sanitizer or MarkdownCodeSanitizer()
         self._config = config or ScoringConfig()
+        self._score_cache: dict[bytes, float] = {}
     
     @abstractmethod
     def _calculate_score(self, code: str) -> ScoringResult:
@@ -211,16 +277,59 @@ class BaseScoringService(ABC):
         """
         try:
             sanitized = self._sanitizer.sanitize(code)
+
+            # Opt-in fast path: no suspicious token, no possible finding
+            if self._config.use_prefilter and not _SUSPICIOUS_RE.search(sanitized):
+                return 0.0
+
+            cache_key = None
+            if self._config.score_cache_size > 0:
+                cache_key = hashlib.blake2b(
+                    sanitized.encode("utf-8"), digest_size=16
+                ).digest()
+                cached = self._score_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
             result = self._calculate_score(sanitized)
+
+            # Only cache successful analyses; errors (missing Bandit,
+            # timeouts) are transient and must be retried next call.
+            if cache_key is not None and result.error is None:
+                if len(self._score_cache) >= self._config.score_cache_size:
+                    # FIFO eviction keeps the cache bounded without
+                    # per-hit LRU bookkeeping
+                    del self._score_cache[next(iter(self._score_cache))]
+                self._score_cache[cache_key] = result.score
+
             return result.score
         except ScoringError:
             raise
         except Exception as e:
-            logger.error(f"Unexpected scoring error: {e}")
+            logger.error("Unexpected scoring error: %s", e)
             if self._config.fail_closed:
                 return 1.0
             raise ScoringError(f"Scoring failed: {e}") from e
 
+    def clear_cache(self) -> None:
+        """Drop all memoized snippet scores."""
+        self._score_cache.clear()
+
+    def score_many(self, codes: list[str]) -> list[float]:
+        """
+        Calculate security risk scores for a batch of code snippets.
+
+        The base implementation scores each snippet in turn; subclasses
+        may override it to amortize per-call overhead across the batch.
+
+        Args:
+            codes: Python source code snippets to analyze.
+
+        Returns:
+            One score per snippet, in input order.
+        """
+        return [self.score(code) for code in codes]
+
 
 # =============================================================================
 # Bandit Scorer
@@ -275,19 +384,30 @@ class BanditScorer(BaseScoringService):
             config: Scoring configuration.
         """
         super().__init__(sanitizer=sanitizer, config=config)
-        
-        if config and config.use_ramdisk:
-            self._temp_manager = temp_file_manager or RamdiskTempFileManager(
-                config.ramdisk_path
-            )
+
+        if temp_file_manager is not None:
+            self._temp_manager = temp_file_manager
+        elif self._config.use_ramdisk or self._config.in_process:
+            # In-process scoring leaves the temp file write as the only
+            # I/O per call, so it opts into the ramdisk automatically.
+            try:
+                self._temp_manager = RamdiskTempFileManager(self._config.ramdisk_path)
+            except OSError as e:
+                logger.warning("Ramdisk unavailable (%s); using standard temp dir", e)
+                self._temp_manager = StandardTempFileManager()
         else:
-            self._temp_manager = temp_file_manager or StandardTempFileManager()
+            self._temp_manager = StandardTempFileManager()
     
     @staticmethod
     @lru_cache(maxsize=1)
     def _find_bandit() -> str | None:
-        """Find Bandit executable path (cached)."""
-        return shutil.which("bandit")
+        """Find Bandit executable path (cached).
+
+        Goes through the module-level _which binding so tests can patch
+        assured_sentinel.core.scorer._which instead of the global
+        shutil.which, keeping the fake scoped to this module.
+        """
+        return _which("bandit")
     
     def _calculate_score(self, code: str) -> ScoringResult:
         """
@@ -299,6 +419,23 @@ class BanditScorer(BaseScoringService):
         Returns:
             ScoringResult with score and issues.
         """
+        # Cheap AST pre-check: syntax errors fail closed and empty
+        # modules are trivially clean — either way Bandit would only
+        # rediscover what one ast.parse call already tells us.
+        try:
+            tree = ast.parse(code)
+        except (SyntaxError, ValueError):
+            return ScoringResult(score=1.0, error="Code parse error: invalid syntax")
+        if not tree.body:
+            return ScoringResult(score=0.0)
+
+        # In-process path: reuse the parent interpreter's Bandit import
+        if self._config.in_process:
+            result = self._score_in_process(code)
+            if result is not None:
+                return result
+            # Bandit API unavailable: fall through to subprocess path
+
         # Check Bandit availability
         bandit_path = self._find_bandit()
         if not bandit_path:
@@ -306,36 +443,204 @@ class BanditScorer(BaseScoringService):
             if self._config.fail_closed:
                 return ScoringResult(score=1.0, error="Bandit not found")
             raise BanditNotFoundError()
-        
-        # Create temp file
-        temp_path = self._temp_manager.create(code)
-        
+
         try:
-            # Run Bandit
+            # Run Bandit, piping the code via stdin ('-' target) so no
+            # temp file is written or cleaned up for single snippets
             result = subprocess.run(
-                ["bandit", "-f", "json", "-q", "--exit-zero", str(temp_path)],
+                ["bandit", "-f", "json", "-q", "--exit-zero", "-"],
+                input=code,
                 capture_output=True,
                 text=True,
                 timeout=self._config.timeout_seconds,
             )
-            
+
             return self._parse_bandit_output(result.stdout, result.stderr)
-            
+
         except subprocess.TimeoutExpired:
-            logger.error(f"Bandit timed out after {self._config.timeout_seconds}s")
+            logger.error("Bandit timed out after %ss", self._config.timeout_seconds)
             if self._config.fail_closed:
                 return ScoringResult(score=1.0, error="Timeout")
             raise ScoringTimeoutError(self._config.timeout_seconds)
-            
+
         except Exception as e:
-            logger.error(f"Bandit execution failed: {e}")
+            logger.error("Bandit execution failed: %s", e)
             if self._config.fail_closed:
                 return ScoringResult(score=1.0, error=str(e))
             raise BanditExecutionError(str(e)) from e
-            
+    
+    def score_many(self, codes: list[str]) -> list[float]:
+        """
+        Score a batch of snippets with a single Bandit invocation.
+
+        Writes each sanitized snippet to its own temp file and analyzes
+        all of them in one pass, paying Bandit's startup cost once
+        instead of once per snippet. Files Bandit cannot parse fail
+        closed to 1.0 individually; the rest of the batch is unaffected.
+
+        Args:
+            codes: Python source code snippets to analyze.
+
+        Returns:
+            One score per snippet, in input order.
+        """
+        if not codes:
+            return []
+
+        sanitized = [self._sanitizer.sanitize(code) for code in codes]
+        paths = [self._temp_manager.create(code) for code in sanitized]
+
+        try:
+            scores = self._score_files([str(p) for p in paths])
+            return [scores.get(str(p), 0.0) for p in paths]
+        except ScoringError:
+            raise
+        except Exception as e:
+            logger.error("Batch scoring failed: %s", e)
+            if self._config.fail_closed:
+                return [1.0] * len(codes)
+            raise BanditExecutionError(str(e)) from e
+        finally:
+            for path in paths:
+                self._temp_manager.cleanup(path)
+
+    def _score_files(self, filenames: list[str]) -> dict[str, float]:
+        """
+        Analyze a set of files in one Bandit pass.
+
+        Args:
+            filenames: Paths of the files to analyze.
+
+        Returns:
+            Mapping of filename to score; unparseable files map to 1.0.
+        """
+        if self._config.in_process:
+            api = _load_bandit_api()
+            if api is not None:
+                return self._score_files_in_process(filenames, api)
+
+        bandit_path = self._find_bandit()
+        if not bandit_path:
+            logger.error("Bandit executable not found in PATH")
+            if self._config.fail_closed:
+                return {name: 1.0 for name in filenames}
+            raise BanditNotFoundError()
+
+        result = subprocess.run(
+            ["bandit", "-f", "json", "-q", "--exit-zero", *filenames],
+            capture_output=True,
+            text=True,
+            timeout=self._config.timeout_seconds * len(filenames),
+        )
+        report = _json_loads(result.stdout)
+
+        severities: dict[str, list[Severity]] = {name: [] for name in filenames}
+        for item in report.get("results", []):
+            severities.setdefault(item.get("filename", ""), []).append(
+                self._coerce_severity(item.get("issue_severity", "LOW"))
+            )
+
+        scores = {
+            name: self._aggregate_severities(sevs)
+            for name, sevs in severities.items()
+        }
+        for error in report.get("errors", []):
+            fname = error.get("filename")
+            if fname in scores:
+                scores[fname] = 1.0
+        return scores
+
+    def _score_files_in_process(
+        self, filenames: list[str], api: tuple
+    ) -> dict[str, float]:
+        """Analyze a set of files in one pass via Bandit's Python API."""
+        manager_cls, bandit_conf = api
+        mgr = manager_cls(bandit_conf, "file", quiet=True)
+        mgr.discover_files(filenames)
+        mgr.run_tests()
+
+        severities: dict[str, list[Severity]] = {name: [] for name in filenames}
+        for item in mgr.get_issue_list():
+            severities.setdefault(item.fname, []).append(
+                self._coerce_severity(str(item.severity))
+            )
+
+        scores = {
+            name: self._aggregate_severities(sevs)
+            for name, sevs in severities.items()
+        }
+        for fname, reason in mgr.skipped:
+            logger.warning("Bandit skipped %s (syntax?): %s", fname, reason)
+            scores[fname] = 1.0
+        return scores
+
+    def _score_in_process(self, code: str) -> ScoringResult | None:
+        """
+        Score code via Bandit's Python API without spawning a subprocess.
+
+        Avoids the fork/exec, child interpreter startup, and JSON
+        round-trip of the subprocess path; plugin loading is amortized
+        across the process lifetime via _load_bandit_api.
+
+        Args:
+            code: Sanitized code to analyze.
+
+        Returns:
+            ScoringResult, or None if the Bandit API is unavailable
+            (caller falls back to the subprocess path).
+        """
+        api = _load_bandit_api()
+        if api is None:
+            return None
+        manager_cls, bandit_conf = api
+
+        temp_path = self._temp_manager.create(code)
+
+        try:
+            mgr = manager_cls(bandit_conf, "file", quiet=True)
+            mgr.discover_files([str(temp_path)])
+            mgr.run_tests()
+
+            # Files Bandit could not parse (syntax errors) fail closed
+            if mgr.skipped:
+                reason = mgr.skipped[0][1] if mgr.skipped[0] else "unknown"
+                logger.warning("Bandit skipped file (syntax?): %s", reason)
+                return ScoringResult(score=1.0, error=f"Code parse error: {reason}")
+
+            issues: list[SecurityIssue] = []
+            severities: list[Severity] = []
+            log_issues = logger.isEnabledFor(logging.WARNING)
+
+            for item in mgr.get_issue_list():
+                severity = self._coerce_severity(str(item.severity))
+
+                issues.append(
+                    SecurityIssue(
+                        test_id=item.test_id,
+                        severity=severity,
+                        confidence=str(item.confidence),
+                        description=item.text,
+                        line_number=item.lineno,
+                    )
+                )
+                severities.append(severity)
+                if log_issues:
+                    logger.warning("Issue: %s (%s)", item.test_id, severity.value)
+
+            return ScoringResult(
+                score=self._aggregate_severities(severities),
+                issues=issues,
+            )
+
+        except Exception as e:
+            logger.error("In-process Bandit scan failed: %s", e)
+            if self._config.fail_closed:
+                return ScoringResult(score=1.0, error=str(e))
+            raise BanditExecutionError(str(e)) from e
+
         finally:
             self._temp_manager.cleanup(temp_path)
-    
+
     def _parse_bandit_output(self, stdout: str, stderr: str) -> ScoringResult:
         """
         Parse Bandit JSON output into ScoringResult.
@@ -348,9 +653,10 @@ class BanditScorer(BaseScoringService):
             ScoringResult with score and issues.
         """
         try:
-            report = json.loads(stdout)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Bandit JSON: {e}")
+            report = _json_loads(stdout)
+        except ValueError as e:
+            # Covers stdlib JSONDecodeError and orjson.JSONDecodeError
+            logger.error("Failed to parse Bandit JSON: %s", e)
             if self._config.fail_closed:
                 return ScoringResult(score=1.0, error=f"JSON parse error: {stderr}")
             raise BanditParseError("Invalid JSON output", stdout[:200])
@@ -358,7 +664,7 @@ class BanditScorer(BaseScoringService):
         # Check for parsing errors (syntax errors in analyzed code)
         errors = report.get("errors", [])
         if errors:
-            logger.warning(f"Bandit reported errors (syntax?): {errors}")
+            logger.warning("Bandit reported errors (syntax?): %s", errors)
             return ScoringResult(
                 score=1.0,
                 error=f"Code parse error: {errors[0].get('reason', 'unknown')}",
@@ -370,17 +676,14 @@ class BanditScorer(BaseScoringService):
         if not results:
             return ScoringResult(score=0.0)
         
-        # Convert to SecurityIssue models and calculate max score
+        # Convert to SecurityIssue models
         issues: list[SecurityIssue] = []
-        max_score = 0.0
-        
+        severities: list[Severity] = []
+        log_issues = logger.isEnabledFor(logging.WARNING)
+
         for item in results:
-            severity_str = item.get("issue_severity", "LOW").upper()
-            try:
-                severity = Severity(severity_str)
-            except ValueError:
-                severity = Severity.LOW
-            
+            severity = self._coerce_severity(item.get("issue_severity", "LOW"))
+
             issue = SecurityIssue(
                 test_id=item.get("test_id", "UNKNOWN"),
                 severity=severity,
@@ -389,46 +692,99 @@ class BanditScorer(BaseScoringService):
                 line_number=item.get("line_number"),
             )
             issues.append(issue)
-            
-            severity_score = self.SEVERITY_SCORES.get(severity, 0.1)
-            logger.warning(f"Issue: {issue.test_id} ({severity.value})")
-            
-            # HIGH severity returns immediately
+            severities.append(severity)
+            if log_issues:
+                logger.warning("Issue: %s (%s)", issue.test_id, severity.value)
+
+        return ScoringResult(
+            score=self._aggregate_severities(severities),
+            issues=issues,
+        )
+
+    @staticmethod
+    def _coerce_severity(value: str) -> Severity:
+        """Map a Bandit severity string to a Severity, defaulting to LOW."""
+        try:
+            return Severity(str(value).upper())
+        except ValueError:
+            return Severity.LOW
+
+    @classmethod
+    def _aggregate_severities(cls, severities: list[Severity]) -> float:
+        """
+        Reduce per-issue severities to a single non-conformity score.
+
+        Single-pass running-max reduction over the SEVERITY_SCORES
+        mapping; HIGH severity short-circuits to 1.0 immediately.
+        Batch callers aggregating issues across many snippets can
+        reuse this instead of re-branching per issue.
+
+        Args:
+            severities: Severities of all issues found in one snippet.
+
+        Returns:
+            Float between 0.0 (no issues) and 1.0 (high severity).
+        """
+        score = 0.0
+        for severity in severities:
             if severity == Severity.HIGH:
-                return ScoringResult(score=1.0, issues=issues)
-            
-            max_score = max(max_score, severity_score)
-        
-        return ScoringResult(score=max_score, issues=issues)
+                return 1.0
+            score = max(score, cls.SEVERITY_SCORES.get(severity, 0.1))
+        return score
 
 
 # =============================================================================
 # Factory Function
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def _default_config() -> ScoringConfig:
+    """Build the all-defaults ScoringConfig once (cached).
+
+    Pydantic model construction runs full field validation; callers
+    hitting create_scorer with default arguments share one validated
+    instance instead of paying that per call. Scorers never mutate
+    their config, so sharing is safe.
+    """
+    return ScoringConfig()
+
+
 def create_scorer(
     use_ramdisk: bool = False,
     ramdisk_path: Path | None = None,
     timeout_seconds: int = 30,
     fail_closed: bool = True,
+    in_process: bool = False,
 ) -> BanditScorer:
     """
     Factory function to create a configured BanditScorer.
-    
+
     Args:
         use_ramdisk: Use ramdisk for temp files (performance optimization).
         ramdisk_path: Custom ramdisk path. Uses /dev/shm/sentinel if None.
         timeout_seconds: Timeout for Bandit execution.
         fail_closed: Return 1.0 on any error if True.
-        
+        in_process: Use Bandit's Python API in-process instead of a
+            subprocess per snippet (performance optimization).
+
     Returns:
         Configured BanditScorer instance.
     """
+    if (
+        not use_ramdisk
+        and ramdisk_path is None
+        and timeout_seconds == 30
+        and fail_closed
+        and not in_process
+    ):
+        return BanditScorer(config=_default_config())
+
     config = ScoringConfig(
         timeout_seconds=timeout_seconds,
         fail_closed=fail_closed,
         use_ramdisk=use_ramdisk,
         ramdisk_path=ramdisk_path or Path("/dev/shm/sentinel"),
+        in_process=in_process,
     )
     return BanditScorer(config=config)
 
@@ -441,6 +797,22 @@ def create_scorer(
 _default_scorer: BanditScorer | None = None
 
 
+def get_default_scorer() -> BanditScorer:
+    """
+    Return the shared default-configuration BanditScorer.
+
+    Construction probes the filesystem for the bandit executable and
+    sets up temp-file management, all invariant for the default config,
+    so callers that need "a scorer" (Commander without an explicit one,
+    the module-level convenience functions) share a single instance —
+    and with it the memoized score cache.
+    """
+    global _default_scorer
+    if _default_scorer is None:
+        _default_scorer = BanditScorer()
+    return _default_scorer
+
+
 def calculate_score(code_snippet: str) -> float:
     """
     Calculate security score for code (backward compatibility function).
@@ -454,10 +826,24 @@ def calculate_score(code_snippet: str) -> float:
     Returns:
         Float between 0.0 and 1.0.
     """
-    global _default_scorer
-    if _default_scorer is None:
-        _default_scorer = BanditScorer()
-    return _default_scorer.score(code_snippet)
+    return get_default_scorer().score(code_snippet)
+
+
+def calculate_scores(code_snippets: list[str]) -> list[float]:
+    """
+    Calculate security scores for a batch of snippets.
+
+    Batch companion to calculate_score: the whole batch is analyzed in
+    one Bandit pass via BanditScorer.score_many, so callers scoring many
+    snippets pay startup cost once. For new code, prefer the class.
+
+    Args:
+        code_snippets: Python code snippets to analyze.
+
+    Returns:
+        One score per snippet, in input order.
+    """
+    return get_default_scorer().score_many(code_snippets)
 
 
 def _clean_code(code: str) -> str:
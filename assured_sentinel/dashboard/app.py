@@ -65,16 +65,40 @@ def get_analyst():
     return AzureAnalyst()
 
 
-def load_calibration_data() -> CalibrationData | None:
-    """Load calibration data from JSON file."""
+def _calibration_mtime_ns(path: Path) -> int | None:
+    """Get calibration file mtime in nanoseconds, or None if missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@st.cache_data
+def load_calibration_data(mtime_ns: int | None) -> CalibrationData | None:
+    """
+    Load calibration data from JSON file (cached per file mtime).
+
+    Streamlit reruns the whole script on every widget interaction;
+    keying the cache on the file's mtime means the JSON is only
+    re-parsed when calibration actually regenerates.
+    """
+    if mtime_ns is None:
+        return None
+
     settings = get_settings()
     store = JsonCalibrationStore(settings.calibration_path)
-    
+
     if store.exists():
         return store.load()
     return None
 
 
+@st.cache_data
+def get_scores_frame(scores: list[float]) -> pd.DataFrame:
+    """Build the score distribution DataFrame (cached across reruns)."""
+    return pd.DataFrame(scores, columns=["Score"])
+
+
 # =============================================================================
 # Sidebar
 # =============================================================================
@@ -91,8 +115,8 @@ threshold_input = st.sidebar.slider(
     step=0.01,
 )
 
-# Load calibration data
-calibration = load_calibration_data()
+# Load calibration data (cache invalidates when the file changes on disk)
+calibration = load_calibration_data(_calibration_mtime_ns(settings.calibration_path))
 
 if calibration:
     st.sidebar.success(
@@ -194,7 +218,7 @@ with tab2:
         # Score distribution
         st.markdown("### Non-Conformity Score Distribution")
         
-        df_scores = pd.DataFrame(calibration.scores, columns=["Score"])
+        df_scores = get_scores_frame(calibration.scores)
         
         # Histogram
         st.bar_chart(df_scores["Score"].value_counts().sort_index())
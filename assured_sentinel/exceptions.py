@@ -86,10 +86,16 @@ class ScoringTimeoutError(ScoringError):
     Attributes:
         timeout_seconds: The timeout that was exceeded.
     """
-    
+
+    # Message templates are class-level constants so each raise formats
+    # an interned template instead of rebuilding an f-string.
+    _TEMPLATE = "Scoring timed out after {timeout_seconds} seconds"
+
     def __init__(self, timeout_seconds: int):
         self.timeout_seconds = timeout_seconds
-        super().__init__(f"Scoring timed out after {timeout_seconds} seconds")
+        super().__init__(
+            self._TEMPLATE.format_map({"timeout_seconds": timeout_seconds})
+        )
 
 
 class CodeSyntaxError(ScoringError):
@@ -134,9 +140,11 @@ class CalibrationFileNotFoundError(CalibrationError):
         path: Path that was not found.
     """
     
+    _TEMPLATE = "Calibration file not found: {path}"
+
     def __init__(self, path: str):
         self.path = path
-        super().__init__(f"Calibration file not found: {path}")
+        super().__init__(self._TEMPLATE.format_map({"path": path}))
 
 
 class CalibrationFileCorruptError(CalibrationError):
@@ -148,10 +156,14 @@ class CalibrationFileCorruptError(CalibrationError):
         details: Parse error details.
     """
     
+    _TEMPLATE = "Calibration file corrupt: {path}. {details}"
+
     def __init__(self, path: str, details: str = ""):
         self.path = path
         self.details = details
-        super().__init__(f"Calibration file corrupt: {path}. {details}")
+        super().__init__(
+            self._TEMPLATE.format_map({"path": path, "details": details})
+        )
 
 
 class DatasetLoadError(CalibrationError):
@@ -176,12 +188,18 @@ class InsufficientSamplesError(CalibrationError):
         available: Number of samples available.
     """
     
+    _TEMPLATE = (
+        "Insufficient samples for calibration. "
+        "Required: {required}, Available: {available}"
+    )
+
     def __init__(self, required: int, available: int):
         self.required = required
         self.available = available
         super().__init__(
-            f"Insufficient samples for calibration. "
-            f"Required: {required}, Available: {available}"
+            self._TEMPLATE.format_map(
+                {"required": required, "available": available}
+            )
         )
 
 
@@ -258,9 +276,13 @@ class LLMTimeoutError(AnalystError):
         timeout_seconds: The timeout that was exceeded.
     """
     
+    _TEMPLATE = "LLM request timed out after {timeout_seconds} seconds"
+
     def __init__(self, timeout_seconds: int):
         self.timeout_seconds = timeout_seconds
-        super().__init__(f"LLM request timed out after {timeout_seconds} seconds")
+        super().__init__(
+            self._TEMPLATE.format_map({"timeout_seconds": timeout_seconds})
+        )
 
 
 class MissingCredentialsError(AnalystError):
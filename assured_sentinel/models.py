@@ -10,7 +10,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 
 class VerificationStatus(str, Enum):
@@ -39,7 +40,11 @@ class VerificationResult(BaseModel):
         reason: Human-readable explanation of the decision.
         latency_ms: Time taken for verification in milliseconds.
     """
-    
+
+    # Results are immutable snapshots; frozen skips assignment
+    # validation machinery and makes instances hashable.
+    model_config = ConfigDict(frozen=True)
+
     status: VerificationStatus
     score: Annotated[float, Field(ge=0.0, le=1.0)]
     threshold: Annotated[float, Field(ge=0.0, le=1.0)]
@@ -73,7 +78,9 @@ class SecurityIssue(BaseModel):
         description: Human-readable description.
         line_number: Line where the issue was found.
     """
-    
+
+    model_config = ConfigDict(frozen=True)
+
     test_id: str
     severity: Severity
     confidence: str = "MEDIUM"
@@ -90,7 +97,9 @@ class ScoringResult(BaseModel):
         issues: List of security issues found.
         error: Error message if scoring failed.
     """
-    
+
+    model_config = ConfigDict(frozen=True)
+
     score: Annotated[float, Field(ge=0.0, le=1.0)]
     issues: list[SecurityIssue] = Field(default_factory=list)
     error: str | None = None
@@ -109,7 +118,10 @@ class CalibrationData(BaseModel):
         q_hat: Calibrated threshold.
         alpha: Risk tolerance used during calibration.
         n_samples: Number of samples used for calibration.
-        scores: Raw scores from calibration set.
+        scores: Raw scores from calibration set, stored as a float64
+            NumPy array (7x smaller than boxed floats at scale, and
+            quantile/min/max run vectorized). Lists are coerced on
+            input and serialized back to lists for JSON.
         dataset: Name of the dataset used.
         dataset_hash: Hash for reproducibility tracking.
         scorer: Name of the scorer used.
@@ -118,10 +130,12 @@ class CalibrationData(BaseModel):
         notes: Additional notes about calibration.
     """
     
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     q_hat: Annotated[float, Field(ge=0.0, le=1.0)]
     alpha: Annotated[float, Field(gt=0.0, lt=1.0)]
     n_samples: Annotated[int, Field(gt=0)]
-    scores: list[float] = Field(default_factory=list)
+    scores: np.ndarray = Field(default_factory=lambda: np.empty(0, dtype=np.float64))
     dataset: str = "unknown"
     dataset_hash: str = ""
     scorer: str = "bandit"
@@ -129,14 +143,19 @@ class CalibrationData(BaseModel):
     calibrated_at: datetime = Field(default_factory=datetime.utcnow)
     notes: str = ""
     
-    @field_validator("scores")
+    @field_validator("scores", mode="before")
     @classmethod
-    def validate_scores(cls, v: list[float]) -> list[float]:
-        """Ensure all scores are in valid range."""
-        for score in v:
-            if not 0.0 <= score <= 1.0:
-                raise ValueError(f"Score {score} not in range [0.0, 1.0]")
-        return v
+    def validate_scores(cls, v) -> np.ndarray:
+        """Coerce to float64 array and range-check vectorized."""
+        arr = np.asarray(v, dtype=np.float64)
+        if arr.size and (arr.min() < 0.0 or arr.max() > 1.0):
+            raise ValueError("Scores must be in range [0.0, 1.0]")
+        return arr
+
+    @field_serializer("scores")
+    def _serialize_scores(self, v: np.ndarray) -> list[float]:
+        """Serialize the scores array back to a plain list for JSON."""
+        return v.tolist()
 
 
 class ScoringConfig(BaseModel):
@@ -148,12 +167,23 @@ class ScoringConfig(BaseModel):
         fail_closed: If True, return 1.0 on any error.
         use_ramdisk: If True, use ramdisk for temp files.
         ramdisk_path: Path to ramdisk mount.
+        in_process: If True, call Bandit's Python API in-process
+            instead of spawning a subprocess per snippet.
+        score_cache_size: Maximum number of memoized snippet scores,
+            keyed by content hash. 0 disables the cache.
+        use_prefilter: If True, return 0.0 without running Bandit for
+            code containing none of the tokens Bandit can flag. Off by
+            default: the gate is fail-closed, and the pre-filter trades
+            a sliver of coverage for speed.
     """
-    
+
     timeout_seconds: int = 30
     fail_closed: bool = True
     use_ramdisk: bool = False
     ramdisk_path: Path = Path("/dev/shm/sentinel")
+    in_process: bool = False
+    score_cache_size: Annotated[int, Field(ge=0)] = 1024
+    use_prefilter: bool = False
 
 
 class VerificationConfig(BaseModel):
@@ -36,6 +36,7 @@ from assured_sentinel.core.scorer import (
     StandardTempFileManager,
     RamdiskTempFileManager,
     calculate_score,
+    calculate_scores,
     _clean_code,
 )
 
@@ -45,5 +46,6 @@ __all__ = [
     "StandardTempFileManager",
     "RamdiskTempFileManager",
     "calculate_score",
+    "calculate_scores",
     "_clean_code",
 ]
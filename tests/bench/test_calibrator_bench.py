@@ -0,0 +1,62 @@
+"""
+Microbenchmarks for the conformal calibration kernel.
+
+These lock in the performance of ConformalCalibrator.calibrate so
+regressions show up in pytest-benchmark's compare mode. They are
+marked `bench` and skip entirely when pytest-benchmark is not
+installed, so the regular unit-test run stays fast.
+
+Run with:
+    pytest tests/bench/ -m bench --benchmark-autosave
+"""
+
+import numpy as np
+import pytest
+
+from assured_sentinel.core.calibrator import ConformalCalibrator
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.bench
+
+
+@pytest.fixture(scope="module")
+def calibration_scores() -> np.ndarray:
+    """A realistic 100-sample score distribution (80/10/5/5 split)."""
+    return np.asarray(
+        [0.0] * 80 + [0.1] * 10 + [0.5] * 5 + [1.0] * 5, dtype=np.float64
+    )
+
+
+def test_calibrate_100(benchmark, calibration_scores: np.ndarray):
+    """Benchmark calibrate() on a 100-sample score array."""
+    calibrator = ConformalCalibrator()
+
+    result = benchmark.pedantic(
+        calibrator.calibrate,
+        args=(calibration_scores, 0.1),
+        rounds=200,
+        iterations=100,
+        warmup_rounds=5,
+    )
+
+    assert 0.0 <= result <= 1.0
+
+
+def test_calibrate_10k(benchmark):
+    """Benchmark calibrate() on a large (10^4) score array."""
+    rng = np.random.default_rng(42)
+    scores = rng.choice(
+        [0.0, 0.1, 0.5, 1.0], size=10_000, p=[0.8, 0.1, 0.05, 0.05]
+    )
+    calibrator = ConformalCalibrator()
+
+    result = benchmark.pedantic(
+        calibrator.calibrate,
+        args=(scores, 0.1),
+        rounds=50,
+        iterations=10,
+        warmup_rounds=5,
+    )
+
+    assert 0.0 <= result <= 1.0
@@ -2,12 +2,25 @@
 Pytest fixtures and configuration for Assured Sentinel tests.
 """
 
+import asyncio
+import sys
+
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 import tempfile
 import json
 
+try:
+    # uvloop dispatches ~2-4x faster than the default loop; the async
+    # tests run on it when it is installed (see the dev extra).
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 from assured_sentinel.models import (
     CalibrationData,
     ScoringConfig,
@@ -86,6 +99,55 @@ def verification_config(tmp_path: Path) -> VerificationConfig:
     )
 
 
+@pytest.fixture(scope="session")
+def base_verification_config() -> VerificationConfig:
+    """Session-scoped validated VerificationConfig base.
+
+    Tests derive variants with model_copy(update=...), which skips the
+    full Pydantic validation pass a fresh constructor call would pay.
+    """
+    return VerificationConfig(default_threshold=0.15)
+
+
+@pytest.fixture(scope="session")
+def corrupt_cal_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped path to a calibration file with invalid JSON.
+
+    The file is never mutated, so tests that only need "a corrupt
+    calibration file exists" share one instead of paying a fresh
+    mkdtemp/teardown each.
+    """
+    path = tmp_path_factory.mktemp("cal") / "corrupt.json"
+    path.write_text("not valid json {{{")
+    return path
+
+
+@pytest.fixture(scope="session")
+def missing_cal_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped path to a calibration file that does not exist."""
+    return tmp_path_factory.mktemp("empty") / "nonexistent.json"
+
+
+@pytest.fixture(scope="session")
+def shared_commander(tmp_path_factory: pytest.TempPathFactory):
+    """
+    Session-scoped Commander with the default 0.15 threshold.
+
+    Commander construction loads calibration and builds a real scorer,
+    which is pure repeated overhead for tests that only call verify.
+    The calibration path points at a file that never exists so the
+    default threshold applies regardless of any repo-level calibration.
+    Tests that mutate threshold or calibration must build their own.
+    """
+    from assured_sentinel.core.commander import Commander
+
+    config = VerificationConfig(
+        default_threshold=0.15,
+        calibration_path=tmp_path_factory.mktemp("shared") / "none.json",
+    )
+    return Commander(config=config)
+
+
 # =============================================================================
 # Mock Fixtures
 # =============================================================================
@@ -180,6 +242,58 @@ def calibration_file(tmp_path: Path, sample_calibration_data: CalibrationData) -
 # Scorer Fixtures
 # =============================================================================
 
+@pytest.fixture
+def mock_bandit(monkeypatch):
+    """Patch the Bandit subprocess to return canned JSON output.
+
+    Returns a callable taking the stdout payload. It installs a fake
+    subprocess.run plus executable lookup through monkeypatch (one
+    teardown instead of nested patch context managers) and returns the
+    run mock so tests can assert on call counts.
+    """
+    from assured_sentinel.core.scorer import BanditScorer
+
+    def _apply(stdout: str) -> MagicMock:
+        # Plain attribute bag: the scorer only reads stdout/stderr, and
+        # SimpleNamespace skips MagicMock's child-mock machinery.
+        result = SimpleNamespace(stdout=stdout, stderr="", returncode=0)
+        run_mock = MagicMock(return_value=result)
+        monkeypatch.setattr("subprocess.run", run_mock)
+        monkeypatch.setattr("assured_sentinel.core.scorer._which", lambda *a, **kw: "/usr/bin/bandit")
+        BanditScorer._find_bandit.cache_clear()
+        return run_mock
+
+    yield _apply
+    # Drop the fake executable path memoized during the test
+    BanditScorer._find_bandit.cache_clear()
+
+
+@pytest.fixture
+def _no_bandit(monkeypatch):
+    """Block bandit imports for tests that fully mock the scorer path.
+
+    Tests that patch shutil.which or subprocess.run never reach Bandit,
+    so importing it (which loads the full plugin registry) is pure
+    overhead. monkeypatch restores sys.modules on teardown.
+    """
+    monkeypatch.setitem(sys.modules, "bandit", None)
+    monkeypatch.setitem(sys.modules, "bandit.core", None)
+
+
+@pytest.fixture(scope="session")
+def shared_scorer():
+    """Session-scoped default-config BanditScorer.
+
+    Scoring is read-only apart from the internal memo cache, so tests
+    that just call score() share one instance instead of re-running
+    construction per test. Tests that clear caches or patch the bandit
+    lookup must build their own.
+    """
+    from assured_sentinel.core.scorer import BanditScorer
+
+    return BanditScorer()
+
+
 @pytest.fixture
 def mock_scorer():
     """Mock scorer that returns configurable scores."""
@@ -27,29 +27,17 @@ from assured_sentinel.models import (
 class TestFullVerificationFlow:
     """Integration tests for the complete verification pipeline."""
     
-    def test_safe_code_passes(self, tmp_path: Path):
+    def test_safe_code_passes(self, shared_commander):
         """Safe code should pass verification."""
-        config = VerificationConfig(
-            default_threshold=0.15,
-            calibration_path=tmp_path / "cal.json",
-        )
-        commander = Commander(config=config)
-        
-        result = commander.verify("def add(a, b):\n    return a + b")
-        
+        result = shared_commander.verify("def add(a, b):\n    return a + b")
+
         assert result.status == VerificationStatus.PASS
         assert result.score == 0.0
-    
-    def test_dangerous_code_rejected(self, tmp_path: Path):
+
+    def test_dangerous_code_rejected(self, shared_commander):
         """Dangerous code should be rejected."""
-        config = VerificationConfig(
-            default_threshold=0.1,
-            calibration_path=tmp_path / "cal.json",
-        )
-        commander = Commander(config=config)
-        
-        result = commander.verify("exec(user_input)")
-        
+        result = shared_commander.verify("exec(user_input)")
+
         assert result.status == VerificationStatus.REJECT
         assert result.score >= 0.5
     
@@ -85,10 +73,14 @@ class TestCalibrationToVerificationFlow:
     
     def test_calibration_produces_usable_threshold(self, tmp_path: Path):
         """Calibration should produce threshold usable by Commander."""
-        # Run calibration
-        mock_scorer = MagicMock()
-        mock_scorer.score.side_effect = [0.0] * 80 + [0.5] * 15 + [1.0] * 5
-        
+        # Plain callable instead of MagicMock: no call-recording overhead
+        # in the 100-sample scoring loop
+        scores_iter = iter([0.0] * 80 + [0.5] * 15 + [1.0] * 5)
+
+        class _FastScorer:
+            def score(self, _code: str) -> float:
+                return next(scores_iter)
+
         cal_path = tmp_path / "cal.json"
         config = CalibrationConfig(
             alpha=0.1,
@@ -97,7 +89,7 @@ class TestCalibrationToVerificationFlow:
         )
         
         runner = CalibrationRunner(
-            scorer=mock_scorer,
+            scorer=_FastScorer(),
             dataset_loader=StaticDatasetLoader(["code"] * 100),
             config=config,
         )
@@ -169,15 +161,20 @@ class TestScanDirectory:
         )
         commander = Commander(config=config)
         
-        results = []
-        for py_file in temp_workspace.rglob("*.py"):
-            code = py_file.read_text()
-            result = commander.verify(code)
-            results.append((py_file.name, result))
-        
+        # Verify the whole workspace as one batch (single scorer pass),
+        # enumerating with the CLI's scandir-based walker rather than
+        # pathlib.rglob
+        from assured_sentinel.cli.main import _iter_python_files
+
+        files = sorted(_iter_python_files(temp_workspace, recursive=True))
+        codes = [
+            p.read_bytes().decode("utf-8", errors="replace") for p in files
+        ]
+        results = commander.verify_many(codes)
+
         # Check results
-        result_dict = {name: r for name, r in results}
-        
+        result_dict = {p.name: r for p, r in zip(files, results)}
+
         assert result_dict["safe.py"].passed
         assert not result_dict["unsafe.py"].passed
 
@@ -185,30 +182,27 @@ class TestScanDirectory:
 class TestErrorRecovery:
     """Tests for error handling and recovery."""
     
-    def test_handles_corrupt_calibration_gracefully(self, tmp_path: Path):
+    def test_handles_corrupt_calibration_gracefully(self, corrupt_cal_path: Path):
         """Should handle corrupt calibration file gracefully."""
-        cal_path = tmp_path / "corrupt.json"
-        cal_path.write_text("not valid json {{{")
-        
         config = VerificationConfig(
             default_threshold=0.15,
-            calibration_path=cal_path,
+            calibration_path=corrupt_cal_path,
         )
-        
+
         # Should not raise, should use default
         commander = Commander(config=config)
-        
+
         assert commander.threshold == 0.15
-    
-    def test_handles_missing_calibration_gracefully(self, tmp_path: Path):
+
+    def test_handles_missing_calibration_gracefully(self, missing_cal_path: Path):
         """Should handle missing calibration file gracefully."""
         config = VerificationConfig(
             default_threshold=0.25,
-            calibration_path=tmp_path / "nonexistent.json",
+            calibration_path=missing_cal_path,
         )
-        
+
         commander = Commander(config=config)
-        
+
         assert commander.threshold == 0.25
     
     def test_verification_continues_after_scorer_error(self, tmp_path: Path):
@@ -25,13 +25,33 @@ from assured_sentinel.exceptions import (
 )
 
 
+class InMemoryCalibrationStore:
+    """ICalibrationStore double that keeps data in memory.
+
+    Lets Commander tests exercise calibration loading without any
+    filesystem traffic.
+    """
+
+    def __init__(self, data: CalibrationData | None = None):
+        self._data = data
+
+    def load(self) -> CalibrationData | None:
+        return self._data
+
+    def save(self, data: CalibrationData) -> None:
+        self._data = data
+
+    def exists(self) -> bool:
+        return self._data is not None
+
+
 class TestJsonCalibrationStore:
     """Tests for the JsonCalibrationStore class."""
     
-    def test_exists_returns_false_for_missing_file(self, tmp_path: Path):
+    def test_exists_returns_false_for_missing_file(self, missing_cal_path: Path):
         """exists() should return False when file doesn't exist."""
-        store = JsonCalibrationStore(tmp_path / "nonexistent.json")
-        
+        store = JsonCalibrationStore(missing_cal_path)
+
         assert store.exists() is False
     
     def test_exists_returns_true_for_existing_file(self, calibration_file: Path):
@@ -40,12 +60,12 @@ class TestJsonCalibrationStore:
         
         assert store.exists() is True
     
-    def test_load_returns_none_for_missing_file(self, tmp_path: Path):
+    def test_load_returns_none_for_missing_file(self, missing_cal_path: Path):
         """load() should return None when file doesn't exist."""
-        store = JsonCalibrationStore(tmp_path / "nonexistent.json")
-        
+        store = JsonCalibrationStore(missing_cal_path)
+
         result = store.load()
-        
+
         assert result is None
     
     def test_load_returns_calibration_data(
@@ -60,15 +80,26 @@ class TestJsonCalibrationStore:
         assert result.q_hat == sample_calibration_data.q_hat
         assert result.alpha == sample_calibration_data.alpha
     
-    def test_load_raises_for_corrupt_file(self, tmp_path: Path):
+    def test_load_raises_for_corrupt_file(self, corrupt_cal_path: Path):
         """load() should raise CalibrationFileCorruptError for invalid JSON."""
-        path = tmp_path / "corrupt.json"
-        path.write_text("not valid json {{{")
-        store = JsonCalibrationStore(path)
-        
+        store = JsonCalibrationStore(corrupt_cal_path)
+
         with pytest.raises(CalibrationFileCorruptError):
             store.load()
     
+    def test_load_is_cached_until_file_changes(
+        self, tmp_path: Path, sample_calibration_data: CalibrationData
+    ):
+        """Repeated loads of an unchanged file should reuse one parse."""
+        path = tmp_path / "calibration.json"
+        store = JsonCalibrationStore(path)
+        store.save(sample_calibration_data)
+
+        first = store.load()
+        second = store.load()
+
+        assert first is second
+
     def test_save_creates_file(self, tmp_path: Path, sample_calibration_data: CalibrationData):
         """save() should create a valid JSON file."""
         path = tmp_path / "new_calibration.json"
@@ -85,11 +116,11 @@ class TestJsonCalibrationStore:
 class TestCommander:
     """Tests for the Commander class."""
     
-    def test_uses_default_threshold_when_no_calibration(self, tmp_path: Path):
+    def test_uses_default_threshold_when_no_calibration(self, missing_cal_path: Path):
         """Should use default threshold if calibration file missing."""
         config = VerificationConfig(
             default_threshold=0.25,
-            calibration_path=tmp_path / "nonexistent.json",
+            calibration_path=missing_cal_path,
         )
         
         commander = Commander(config=config)
@@ -107,18 +138,22 @@ class TestCommander:
         
         assert commander.threshold == 0.15  # From fixture
     
-    def test_threshold_setter(self, tmp_path: Path):
+    def test_threshold_setter(self, tmp_path: Path, base_verification_config):
         """Should allow manual threshold setting."""
-        config = VerificationConfig(calibration_path=tmp_path / "none.json")
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
+        )
         commander = Commander(config=config)
         
         commander.threshold = 0.5
         
         assert commander.threshold == 0.5
     
-    def test_threshold_setter_validation(self, tmp_path: Path):
+    def test_threshold_setter_validation(self, tmp_path: Path, base_verification_config):
         """Should reject invalid threshold values."""
-        config = VerificationConfig(calibration_path=tmp_path / "none.json")
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
+        )
         commander = Commander(config=config)
         
         with pytest.raises(ValueError):
@@ -127,12 +162,11 @@ class TestCommander:
         with pytest.raises(ValueError):
             commander.threshold = -0.1
     
-    def test_verify_pass_for_low_score(self, mock_scorer, tmp_path: Path):
+    def test_verify_pass_for_low_score(self, mock_scorer, tmp_path: Path, base_verification_config):
         """Should PASS when score <= threshold."""
         mock_scorer.score.return_value = 0.0
-        config = VerificationConfig(
-            default_threshold=0.15,
-            calibration_path=tmp_path / "none.json",
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
         )
         
         commander = Commander(scorer=mock_scorer, config=config)
@@ -142,12 +176,11 @@ class TestCommander:
         assert result.score == 0.0
         assert result.passed is True
     
-    def test_verify_reject_for_high_score(self, mock_scorer, tmp_path: Path):
+    def test_verify_reject_for_high_score(self, mock_scorer, tmp_path: Path, base_verification_config):
         """Should REJECT when score > threshold."""
         mock_scorer.score.return_value = 0.5
-        config = VerificationConfig(
-            default_threshold=0.15,
-            calibration_path=tmp_path / "none.json",
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
         )
         
         commander = Commander(scorer=mock_scorer, config=config)
@@ -157,12 +190,11 @@ class TestCommander:
         assert result.score == 0.5
         assert result.passed is False
     
-    def test_verify_pass_at_boundary(self, mock_scorer, tmp_path: Path):
+    def test_verify_pass_at_boundary(self, mock_scorer, tmp_path: Path, base_verification_config):
         """Should PASS when score == threshold (boundary case)."""
         mock_scorer.score.return_value = 0.15
-        config = VerificationConfig(
-            default_threshold=0.15,
-            calibration_path=tmp_path / "none.json",
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
         )
         
         commander = Commander(scorer=mock_scorer, config=config)
@@ -170,9 +202,11 @@ class TestCommander:
         
         assert result.status == VerificationStatus.PASS
     
-    def test_verify_includes_latency(self, mock_scorer, tmp_path: Path):
+    def test_verify_includes_latency(self, mock_scorer, tmp_path: Path, base_verification_config):
         """Verify result should include latency."""
-        config = VerificationConfig(calibration_path=tmp_path / "none.json")
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
+        )
         commander = Commander(scorer=mock_scorer, config=config)
         
         result = commander.verify("print('hello')")
@@ -180,12 +214,11 @@ class TestCommander:
         assert result.latency_ms is not None
         assert result.latency_ms >= 0
     
-    def test_verify_includes_reason(self, mock_scorer, tmp_path: Path):
+    def test_verify_includes_reason(self, mock_scorer, tmp_path: Path, base_verification_config):
         """Verify result should include reason."""
         mock_scorer.score.return_value = 0.5
-        config = VerificationConfig(
-            default_threshold=0.15,
-            calibration_path=tmp_path / "none.json",
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
         )
         
         commander = Commander(scorer=mock_scorer, config=config)
@@ -193,6 +226,52 @@ class TestCommander:
         
         assert "exceeds threshold" in result.reason
     
+    def test_verify_many_preserves_order(self, mock_scorer, tmp_path: Path, base_verification_config):
+        """verify_many() should return one result per snippet, in order."""
+        mock_scorer.score.side_effect = [0.0, 0.5]
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
+        )
+
+        commander = Commander(scorer=mock_scorer, config=config)
+        results = commander.verify_many(["print('hello')", "exec(x)"])
+
+        assert len(results) == 2
+        assert results[0].status == VerificationStatus.PASS
+        assert results[1].status == VerificationStatus.REJECT
+        assert all(r.latency_ms is not None for r in results)
+
+    async def test_averify_matches_verify(self, mock_scorer, tmp_path: Path, base_verification_config):
+        """averify() should produce the same decision as verify()."""
+        mock_scorer.score.return_value = 0.0
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
+        )
+
+        commander = Commander(scorer=mock_scorer, config=config)
+        result = await commander.averify("print('hello')")
+
+        assert result.status == VerificationStatus.PASS
+
+    def test_verify_many_empty_batch(self, mock_scorer, tmp_path: Path, base_verification_config):
+        """verify_many() should return an empty list for no snippets."""
+        config = base_verification_config.model_copy(
+            update={"calibration_path": tmp_path / "none.json"}
+        )
+        commander = Commander(scorer=mock_scorer, config=config)
+
+        assert commander.verify_many([]) == []
+
+    def test_loads_threshold_from_injected_store(
+        self, sample_calibration_data: CalibrationData
+    ):
+        """Should load threshold from any ICalibrationStore, not just files."""
+        store = InMemoryCalibrationStore(sample_calibration_data)
+
+        commander = Commander(calibration_store=store)
+
+        assert commander.threshold == sample_calibration_data.q_hat
+
     def test_reload_calibration(
         self, tmp_path: Path, sample_calibration_data: CalibrationData
     ):
@@ -220,29 +299,17 @@ class TestCommander:
 class TestIntegration:
     """Integration tests for Commander with real scorer."""
     
-    def test_full_flow_safe_code(self, safe_code, tmp_path: Path):
+    def test_full_flow_safe_code(self, safe_code, shared_commander):
         """Test full verification flow with safe code."""
-        config = VerificationConfig(
-            default_threshold=0.15,
-            calibration_path=tmp_path / "none.json",
-        )
-        commander = Commander(config=config)
-        
-        result = commander.verify(safe_code)
-        
+        result = shared_commander.verify(safe_code)
+
         assert result.status == VerificationStatus.PASS
         assert result.score == 0.0
-    
-    def test_full_flow_dangerous_code(self, dangerous_exec_code, tmp_path: Path):
+
+    def test_full_flow_dangerous_code(self, dangerous_exec_code, shared_commander):
         """Test full verification flow with dangerous code."""
-        config = VerificationConfig(
-            default_threshold=0.1,
-            calibration_path=tmp_path / "none.json",
-        )
-        commander = Commander(config=config)
-        
-        result = commander.verify(dangerous_exec_code)
-        
+        result = shared_commander.verify(dangerous_exec_code)
+
         assert result.status == VerificationStatus.REJECT
         assert result.score >= 0.5
 
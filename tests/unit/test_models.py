@@ -4,6 +4,7 @@ Unit tests for Pydantic models.
 Tests validation, serialization, and model behavior.
 """
 
+import numpy as np
 import pytest
 from datetime import datetime
 
@@ -138,6 +139,20 @@ class TestCalibrationData:
         assert data.alpha == 0.1
         assert data.n_samples == 100
     
+    def test_scores_stored_as_numpy_array(self):
+        """Score lists should be coerced to float64 arrays and back to
+        plain lists on JSON serialization."""
+        data = CalibrationData(
+            q_hat=0.15,
+            alpha=0.1,
+            n_samples=3,
+            scores=[0.0, 0.5, 1.0],
+        )
+
+        assert isinstance(data.scores, np.ndarray)
+        assert data.scores.dtype == np.float64
+        assert data.model_dump(mode="json")["scores"] == [0.0, 0.5, 1.0]
+
     def test_validates_scores_range(self):
         """Should reject scores outside [0, 1]."""
         with pytest.raises(ValueError):
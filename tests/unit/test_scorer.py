@@ -7,6 +7,7 @@ Tests the BanditScorer, MarkdownCodeSanitizer, and related components.
 import json
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, PropertyMock
 
 from assured_sentinel.core.scorer import (
@@ -15,6 +16,7 @@ from assured_sentinel.core.scorer import (
     StandardTempFileManager,
     RamdiskTempFileManager,
     calculate_score,
+    calculate_scores,
     _clean_code,
     create_scorer,
 )
@@ -26,6 +28,27 @@ from assured_sentinel.exceptions import (
 )
 
 
+@pytest.fixture(autouse=True)
+def fake_bandit(request, monkeypatch):
+    """Fake the Bandit subprocess with clean output by default.
+
+    Most tests in this file assert plumbing, not Bandit's verdicts, so
+    they get a canned empty report instead of a real fork+exec. Tests
+    that assert on real severity output opt out with
+    @pytest.mark.real_bandit. Tests that install their own fakes
+    (mock_bandit, _no_bandit, inline patches) simply override this one.
+    """
+    if "real_bandit" in request.keywords:
+        return
+    monkeypatch.setattr(
+        "subprocess.run",
+        lambda *a, **kw: SimpleNamespace(
+            stdout='{"errors": [], "results": []}', stderr="", returncode=0
+        ),
+    )
+    monkeypatch.setattr("assured_sentinel.core.scorer._which", lambda *a, **kw: "/usr/bin/bandit")
+
+
 class TestMarkdownCodeSanitizer:
     """Tests for the MarkdownCodeSanitizer class."""
     
@@ -83,12 +106,13 @@ class TestStandardTempFileManager:
         """Should create a temp file with content."""
         manager = StandardTempFileManager()
         content = "print('test')"
-        
+
         path = manager.create(content)
-        
+
         try:
-            assert path.exists()
-            assert path.read_text() == content
+            # One open covers existence (it would raise) and content
+            with open(path, "rb") as f:
+                assert f.read() == content.encode()
             assert path.suffix == ".py"
         finally:
             manager.cleanup(path)
@@ -111,85 +135,134 @@ class TestStandardTempFileManager:
         manager.cleanup(path)
 
 
+@pytest.mark.skipif(
+    not Path("/dev/shm").is_dir(), reason="No /dev/shm tmpfs mount"
+)
+class TestRamdiskTempFileManager:
+    """Tests for the RamdiskTempFileManager class."""
+
+    def test_creates_temp_file_on_ramdisk(self, tmp_path: Path):
+        """Should create temp files under the ramdisk path."""
+        base = Path("/dev/shm") / tmp_path.name
+        manager = RamdiskTempFileManager(base)
+        content = "print('test')"
+
+        path = manager.create(content)
+
+        try:
+            assert path.exists()
+            assert path.read_text() == content
+            assert path.suffix == ".py"
+            assert path.is_relative_to(base)
+        finally:
+            manager.cleanup(path)
+            base.rmdir()
+
+    def test_cleanup_removes_file(self, tmp_path: Path):
+        """Should remove file on cleanup."""
+        base = Path("/dev/shm") / tmp_path.name
+        manager = RamdiskTempFileManager(base)
+        path = manager.create("test")
+
+        manager.cleanup(path)
+
+        assert not path.exists()
+        base.rmdir()
+
+
+@pytest.mark.xdist_group("bandit")
 class TestBanditScorer:
-    """Tests for the BanditScorer class."""
+    """Tests for the BanditScorer class.
+
+    Grouped for pytest-xdist (--dist loadgroup): several tests here
+    clear the class-level _find_bandit cache, so the classes touching
+    it stay on one worker while the rest of the suite parallelizes.
+    """
     
-    def test_clean_code_returns_zero(self, safe_code):
+    def test_clean_code_returns_zero(self, safe_code, shared_scorer):
         """Clean code with no issues should return 0.0."""
-        scorer = BanditScorer()
-        
-        score = scorer.score(safe_code)
+        score = shared_scorer.score(safe_code)
         
         assert score == 0.0
     
-    def test_exec_code_returns_medium_or_higher(self, dangerous_exec_code):
-        """exec() should be flagged as MEDIUM or higher."""
-        scorer = BanditScorer()
-        
-        score = scorer.score(dangerous_exec_code)
-        
-        assert score >= 0.5
-    
-    def test_eval_code_returns_medium_or_higher(self, dangerous_eval_code):
-        """eval() should be flagged as MEDIUM or higher."""
-        scorer = BanditScorer()
-        
-        score = scorer.score(dangerous_eval_code)
-        
-        assert score >= 0.5
-    
-    def test_pickle_code_returns_medium_or_higher(self, dangerous_pickle_code):
-        """pickle.loads() should be flagged as MEDIUM or higher."""
-        scorer = BanditScorer()
-        
-        score = scorer.score(dangerous_pickle_code)
-        
-        assert score >= 0.5
-    
-    def test_low_severity_returns_point_one(self, low_severity_code):
+    @pytest.mark.real_bandit
+    def test_dangerous_code_batch(
+        self,
+        dangerous_exec_code,
+        dangerous_eval_code,
+        dangerous_pickle_code,
+        shared_scorer,
+    ):
+        """exec()/eval()/pickle.loads() should all be flagged MEDIUM or higher.
+
+        Scored as one score_many batch so all three snippets share a
+        single Bandit launch instead of paying startup cost each.
+        """
+        scores = shared_scorer.score_many(
+            [dangerous_exec_code, dangerous_eval_code, dangerous_pickle_code]
+        )
+
+        assert all(score >= 0.5 for score in scores)
+
+    @pytest.mark.real_bandit
+    def test_low_severity_returns_point_one(self, low_severity_code, shared_scorer):
         """LOW severity issues should return 0.1."""
-        scorer = BanditScorer()
-        
-        score = scorer.score(low_severity_code)
+        score = shared_scorer.score(low_severity_code)
         
         assert score == 0.1
     
-    def test_syntax_error_returns_one_fail_closed(self, syntax_error_code):
+    def test_syntax_error_returns_one_fail_closed(self, syntax_error_code, shared_scorer):
         """Syntax errors should return 1.0 (fail-closed)."""
-        scorer = BanditScorer()
-        
-        score = scorer.score(syntax_error_code)
+        score = shared_scorer.score(syntax_error_code)
         
         assert score == 1.0
     
-    def test_markdown_code_is_cleaned(self, markdown_wrapped_code):
+    def test_markdown_code_is_cleaned(self, markdown_wrapped_code, shared_scorer):
         """Markdown code blocks should be stripped before analysis."""
-        scorer = BanditScorer()
-        
-        score = scorer.score(markdown_wrapped_code)
+        score = shared_scorer.score(markdown_wrapped_code)
         
         assert score == 0.0
     
-    def test_empty_code(self):
-        """Empty code should return 0.0 or 1.0."""
-        scorer = BanditScorer()
-        
-        score = scorer.score("")
-        
-        assert score in [0.0, 1.0]
+    def test_empty_code(self, shared_scorer):
+        """Empty code parses to an empty module and scores 0.0."""
+        score = shared_scorer.score("")
+
+        assert score == 0.0
     
+    def test_empty_module_skips_bandit(self):
+        """Whitespace-only code should return 0.0 without invoking Bandit."""
+        scorer = BanditScorer()
+
+        with patch("subprocess.run") as mock_run:
+            score = scorer.score("   \n\n   ")
+
+        assert score == 0.0
+        mock_run.assert_not_called()
+
+    def test_syntax_error_skips_bandit(self, syntax_error_code):
+        """The AST pre-check should fail closed before spawning Bandit."""
+        scorer = BanditScorer()
+
+        with patch("subprocess.run") as mock_run:
+            score = scorer.score(syntax_error_code)
+
+        assert score == 1.0
+        mock_run.assert_not_called()
+
+    @pytest.mark.usefixtures("_no_bandit")
     def test_bandit_not_found_fail_closed(self):
         """Should return 1.0 when Bandit not found (fail-closed)."""
         config = ScoringConfig(fail_closed=True)
         scorer = BanditScorer(config=config)
         
-        with patch("shutil.which", return_value=None):
+        with patch("assured_sentinel.core.scorer._which", return_value=None):
             # Clear the cache
             scorer._find_bandit.cache_clear()
             score = scorer.score("print('hello')")
         
         assert score == 1.0
     
+    @pytest.mark.usefixtures("_no_bandit")
     def test_subprocess_timeout_fail_closed(self, safe_code):
         """Should return 1.0 on timeout (fail-closed)."""
         import subprocess
@@ -198,75 +271,220 @@ class TestBanditScorer:
         scorer = BanditScorer(config=config)
         
         with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("bandit", 1)):
-            with patch("shutil.which", return_value="/usr/bin/bandit"):
+            with patch("assured_sentinel.core.scorer._which", return_value="/usr/bin/bandit"):
                 scorer._find_bandit.cache_clear()
                 score = scorer.score(safe_code)
         
         assert score == 1.0
 
 
+@pytest.mark.xdist_group("bandit")
 class TestBanditScorerWithMocks:
     """Tests using mocked Bandit output."""
     
-    def test_parse_clean_output(self, mock_bandit_clean_output):
+    def test_parse_clean_output(self, mock_bandit, mock_bandit_clean_output):
         """Should parse clean Bandit output correctly."""
         scorer = BanditScorer()
-        
-        mock_result = MagicMock()
-        mock_result.stdout = mock_bandit_clean_output
-        mock_result.stderr = ""
-        
-        with patch("subprocess.run", return_value=mock_result):
-            with patch("shutil.which", return_value="/usr/bin/bandit"):
-                scorer._find_bandit.cache_clear()
-                score = scorer.score("print('hello')")
-        
+        mock_bandit(mock_bandit_clean_output)
+
+        score = scorer.score("print('hello')")
+
         assert score == 0.0
     
-    def test_parse_medium_severity_output(self, mock_bandit_medium_output):
+    def test_parse_medium_severity_output(self, mock_bandit, mock_bandit_medium_output):
         """Should parse MEDIUM severity output correctly."""
         scorer = BanditScorer()
-        
-        mock_result = MagicMock()
-        mock_result.stdout = mock_bandit_medium_output
-        mock_result.stderr = ""
-        
-        with patch("subprocess.run", return_value=mock_result):
-            with patch("shutil.which", return_value="/usr/bin/bandit"):
-                scorer._find_bandit.cache_clear()
-                score = scorer.score("exec(x)")
-        
+        mock_bandit(mock_bandit_medium_output)
+
+        score = scorer.score("exec(x)")
+
         assert score == 0.5
     
-    def test_parse_high_severity_output(self, mock_bandit_high_output):
+    def test_parse_high_severity_output(self, mock_bandit, mock_bandit_high_output):
         """Should parse HIGH severity output correctly."""
         scorer = BanditScorer()
-        
-        mock_result = MagicMock()
-        mock_result.stdout = mock_bandit_high_output
-        mock_result.stderr = ""
-        
-        with patch("subprocess.run", return_value=mock_result):
-            with patch("shutil.which", return_value="/usr/bin/bandit"):
-                scorer._find_bandit.cache_clear()
-                score = scorer.score("pickle.loads(x)")
-        
+        mock_bandit(mock_bandit_high_output)
+
+        score = scorer.score("pickle.loads(x)")
+
         assert score == 1.0
     
-    def test_parse_syntax_error_output(self, mock_bandit_syntax_error_output):
+    def test_parse_syntax_error_output(self, mock_bandit, mock_bandit_syntax_error_output):
         """Should handle syntax error output."""
         scorer = BanditScorer()
-        
+        mock_bandit(mock_bandit_syntax_error_output)
+
+        score = scorer.score("invalid syntax")
+
+        assert score == 1.0
+
+
+@pytest.mark.xdist_group("bandit")
+class TestScoreCache:
+    """Tests for content-hash memoization of snippet scores."""
+
+    def test_repeat_snippet_hits_cache(self, mock_bandit, mock_bandit_clean_output):
+        """Scoring the same snippet twice should run Bandit only once."""
+        scorer = BanditScorer()
+        mock_run = mock_bandit(mock_bandit_clean_output)
+
+        first = scorer.score("print('cached')")
+        second = scorer.score("print('cached')")
+
+        assert first == second == 0.0
+        assert mock_run.call_count == 1
+
+    def test_error_results_are_not_cached(self, mock_bandit, mock_bandit_clean_output):
+        """Fail-closed 1.0 results must be retried on the next call."""
+        scorer = BanditScorer()
+
+        with patch("assured_sentinel.core.scorer._which", return_value=None):
+            scorer._find_bandit.cache_clear()
+            assert scorer.score("print('transient')") == 1.0
+
+        mock_run = mock_bandit(mock_bandit_clean_output)
+        assert scorer.score("print('transient')") == 0.0
+
+        assert mock_run.call_count == 1
+
+    def test_cache_disabled_with_zero_size(self, mock_bandit, mock_bandit_clean_output):
+        """score_cache_size=0 should disable memoization."""
+        scorer = BanditScorer(config=ScoringConfig(score_cache_size=0))
+        mock_run = mock_bandit(mock_bandit_clean_output)
+
+        scorer.score("print('uncached')")
+        scorer.score("print('uncached')")
+
+        assert mock_run.call_count == 2
+
+    def test_clear_cache_forces_rescore(self, mock_bandit, mock_bandit_clean_output):
+        """clear_cache() should drop memoized scores."""
+        scorer = BanditScorer()
+        mock_run = mock_bandit(mock_bandit_clean_output)
+
+        scorer.score("print('cleared')")
+        scorer.clear_cache()
+        scorer.score("print('cleared')")
+
+        assert mock_run.call_count == 2
+
+
+class TestPrefilter:
+    """Tests for the opt-in suspicious-token pre-filter."""
+
+    def test_clean_code_bypasses_bandit(self, safe_code):
+        """Obviously clean code should return 0.0 without running Bandit."""
+        scorer = BanditScorer(config=ScoringConfig(use_prefilter=True))
+
+        with patch("subprocess.run") as mock_run:
+            score = scorer.score(safe_code)
+
+        assert score == 0.0
+        mock_run.assert_not_called()
+
+    @pytest.mark.real_bandit
+    def test_suspicious_code_still_scored(self, dangerous_exec_code):
+        """Code with suspicious tokens must still go through Bandit."""
+        scorer = BanditScorer(config=ScoringConfig(use_prefilter=True))
+
+        score = scorer.score(dangerous_exec_code)
+
+        assert score >= 0.5
+
+    def test_prefilter_off_by_default(self):
+        """The pre-filter must stay opt-in for the fail-closed gate."""
+        assert ScoringConfig().use_prefilter is False
+
+
+class TestScoreMany:
+    """Tests for batch scoring via score_many()."""
+
+    @pytest.mark.real_bandit
+    def test_mixed_batch_scores_in_order(
+        self, safe_code, dangerous_exec_code, syntax_error_code
+    ):
+        """Batch results should line up with inputs, including failures."""
+        scorer = BanditScorer()
+
+        scores = scorer.score_many([safe_code, dangerous_exec_code, syntax_error_code])
+
+        assert len(scores) == 3
+        assert scores[0] == 0.0
+        assert scores[1] >= 0.5
+        assert scores[2] == 1.0
+
+    def test_empty_batch_returns_empty_list(self):
+        """An empty batch should short-circuit to an empty list."""
+        scorer = BanditScorer()
+
+        assert scorer.score_many([]) == []
+
+    @pytest.mark.real_bandit
+    def test_in_process_batch_matches_subprocess(self, safe_code, dangerous_exec_code):
+        """In-process batching should agree with the subprocess path."""
+        pytest.importorskip("bandit")
+        batch = [safe_code, dangerous_exec_code]
+
+        in_process = create_scorer(in_process=True).score_many(batch)
+        via_subprocess = BanditScorer().score_many(batch)
+
+        assert in_process == via_subprocess
+
+
+@pytest.mark.real_bandit
+class TestInProcessScorer:
+    """Tests for the in-process Bandit scoring path."""
+
+    @pytest.fixture
+    def in_process_scorer(self) -> BanditScorer:
+        """Scorer configured to use Bandit's Python API in-process."""
+        pytest.importorskip("bandit")
+        return create_scorer(in_process=True)
+
+    def test_clean_code_returns_zero(self, in_process_scorer, safe_code):
+        """Clean code should return 0.0 without spawning a subprocess."""
+        score = in_process_scorer.score(safe_code)
+
+        assert score == 0.0
+
+    def test_exec_code_returns_medium_or_higher(self, in_process_scorer, dangerous_exec_code):
+        """exec() should be flagged as MEDIUM or higher."""
+        score = in_process_scorer.score(dangerous_exec_code)
+
+        assert score >= 0.5
+
+    def test_syntax_error_returns_one_fail_closed(self, in_process_scorer, syntax_error_code):
+        """Syntax errors should return 1.0 (fail-closed)."""
+        score = in_process_scorer.score(syntax_error_code)
+
+        assert score == 1.0
+
+    def test_prefers_ramdisk_temp_dir(self, in_process_scorer):
+        """In-process scorers should keep temp files in memory when possible."""
+        if not Path("/dev/shm").is_dir():
+            pytest.skip("No /dev/shm on this platform")
+
+        assert isinstance(in_process_scorer._temp_manager, RamdiskTempFileManager)
+
+    def test_falls_back_to_subprocess_without_bandit_api(
+        self, safe_code, mock_bandit_clean_output
+    ):
+        """Should fall back to the subprocess path when the API is missing."""
+        from assured_sentinel.core import scorer as scorer_module
+
+        scorer = create_scorer(in_process=True)
+
         mock_result = MagicMock()
-        mock_result.stdout = mock_bandit_syntax_error_output
+        mock_result.stdout = mock_bandit_clean_output
         mock_result.stderr = ""
-        
-        with patch("subprocess.run", return_value=mock_result):
-            with patch("shutil.which", return_value="/usr/bin/bandit"):
-                scorer._find_bandit.cache_clear()
-                score = scorer.score("invalid syntax")
-        
-        assert score == 1.0
+
+        with patch.object(scorer_module, "_load_bandit_api", return_value=None):
+            with patch("subprocess.run", return_value=mock_result):
+                with patch("assured_sentinel.core.scorer._which", return_value="/usr/bin/bandit"):
+                    scorer._find_bandit.cache_clear()
+                    score = scorer.score(safe_code)
+
+        assert score == 0.0
 
 
 class TestBackwardCompatibility:
@@ -278,6 +496,14 @@ class TestBackwardCompatibility:
         
         assert score == 0.0
     
+    @pytest.mark.real_bandit
+    def test_calculate_scores_function(self, safe_code, dangerous_exec_code):
+        """calculate_scores() should batch-score in input order."""
+        scores = calculate_scores([safe_code, dangerous_exec_code])
+
+        assert scores[0] == 0.0
+        assert scores[1] >= 0.5
+
     def test_clean_code_function(self):
         """_clean_code() should work as before."""
         code = "```python\nprint('hello')\n```"